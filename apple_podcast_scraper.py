@@ -7,7 +7,7 @@ Supports multiple extraction methods and can handle large podcasts with hundreds
 
 Features:
 - iTunes API for recent episodes (up to 200)
-- Search API for older episodes
+- Paged lookups (falling back to the Search API) for older episodes
 - URL validation
 - Flexible output options
 - Rate limiting protection
@@ -17,41 +17,235 @@ Usage:
     python apple_podcast_scraper.py --help
 """
 
+import asyncio
+import os
+import random
 import requests
 import re
 import time
-from typing import List, Optional
+from itertools import islice
+from pathlib import Path
+from typing import AbstractSet, Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
+import aiohttp
+import ijson
+import orjson
 import typer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 app = typer.Typer(help="Extract episode URLs from Apple Podcasts")
 console = Console()
 
+ITUNES_LOOKUP_URL = "https://itunes.apple.com/lookup"
+ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
+CACHE_DIR = Path.home() / ".cache" / "apple_podcast_scraper"
+LOOKUP_CACHE_TTL = 3600  # Seconds
+LOOKUP_PAGE_SIZE = 200  # iTunes API maximum
+MAX_CONCURRENCY = 10  # Default max in-flight requests to Apple (--concurrency)
+
+_ID_RE = re.compile(r'/id(\d+)')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# The only iTunes result fields the episode search reads
+_RESULT_PREFIXES = {f"results.item.{field}" for field in ('collectionId', 'kind', 'trackId', 'trackName')}
+
+def _make_session() -> requests.Session:
+    """Shared requests session: keep-alive connection pool plus retries on transient errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3,
+                          status_forcelist=[429, 502, 503, 504],
+                          respect_retry_after_header=True),
+    )
+    session.mount('https://', adapter)
+    return session
+
+_SESSION = _make_session()
+
+THROTTLE_STATUSES = (403, 429)  # The iTunes API signals throttling with 403 as well as 429
+MAX_THROTTLE_RETRIES = 3
+
+class RateLimitedError(Exception):
+    """Raised when the iTunes API keeps rejecting a request with 403/429 (rate limited)."""
+
+class AsyncRateLimiter:
+    """
+    Adaptive token bucket shared by concurrent requests to Apple.
+    
+    Tokens refill at `refill_rate` per second, up to `max_concurrent` held at once.
+    A throttle event halves the refill rate and pauses every caller
+    (multiplicative decrease); a streak of successes adds 1 token/sec back
+    (additive increase). Throttle responses that arrive while a pause is
+    already in effect belong to the same event and don't decrease it again.
+    `throttle_events` counts consecutive events since the last success.
+    """
+    
+    def __init__(self, refill_rate: float = 2.0, max_concurrent: int = 5,
+                 min_rate: float = 0.25, max_rate: float = 20.0,
+                 jitter: float = 1.0, success_streak: int = 10):
+        self.tokens = float(max_concurrent)
+        self.refill_rate = refill_rate
+        self.max_concurrent = max_concurrent
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.jitter = jitter
+        self.success_streak = success_streak
+        self.throttle_events = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self.tokens = min(float(self.max_concurrent), self.tokens + elapsed * self.refill_rate)
+        self._updated = now
+    
+    async def acquire(self):
+        """Wait until a token is available (and any throttle pause is over)."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+    
+    def on_success(self, remaining: Optional[int] = None):
+        """Record a successful response, optionally with X-RateLimit-Remaining."""
+        self.throttle_events = 0
+        self._successes += 1
+        if self._successes >= self.success_streak:
+            self.refill_rate = min(self.max_rate, self.refill_rate + 1)
+            self._successes = 0
+        if remaining is not None:
+            # Don't burst past what the server says we have left
+            self.tokens = min(self.tokens, float(remaining))
+    
+    def on_throttle(self, retry_after: float):
+        """Back off after a 403/429: halve the rate and pause all callers until `retry_after` (+ jitter)."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return  # Already backing off for this burst
+        self.throttle_events += 1
+        self.refill_rate = max(self.min_rate, self.refill_rate * 0.5)
+        self._successes = 0
+        self.tokens = 0.0
+        self._paused_until = now + retry_after + random.uniform(0, self.jitter)
+
+def _retry_after(headers: Mapping[str, str], attempt: int) -> float:
+    """Seconds to wait after a throttle response: Retry-After, else exponential backoff."""
+    try:
+        return float(headers.get('Retry-After', ''))
+    except ValueError:
+        return float(2 ** attempt)
+
+def _rate_limit_remaining(headers: Mapping[str, str]) -> Optional[int]:
+    try:
+        return int(headers.get('X-RateLimit-Remaining', ''))
+    except ValueError:
+        return None
+
+async def _limited_request(session: aiohttp.ClientSession, limiter: AsyncRateLimiter,
+                           method: str, url: str,
+                           read: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+                           **kwargs) -> Any:
+    """
+    Issue a request through the rate limiter, backing off and retrying on 403/429.
+    `read` consumes the response. Raises RateLimitedError once this request's retries
+    are exhausted, or once the limiter has backed off MAX_THROTTLE_RETRIES times in a
+    row without any request getting through.
+    """
+    for _ in range(MAX_THROTTLE_RETRIES + 1):
+        await limiter.acquire()
+        async with session.request(method, url, **kwargs) as response:
+            if response.status not in THROTTLE_STATUSES:
+                limiter.on_success(_rate_limit_remaining(response.headers))
+                return await read(response)
+            # acquire() waits out the pause before the retry
+            limiter.on_throttle(_retry_after(response.headers, limiter.throttle_events))
+        if limiter.throttle_events > MAX_THROTTLE_RETRIES:
+            break
+    raise RateLimitedError(url)
+
+def _make_limiter(concurrency: int = MAX_CONCURRENCY, burst: int = 5) -> AsyncRateLimiter:
+    """
+    Rate limiter starting at a conservative pace (`burst` tokens, 2 req/s).
+    `concurrency` only caps in-flight requests (connector limit and semaphores); the rate
+    grows through additive increase while Apple keeps accepting requests.
+    """
+    return AsyncRateLimiter(max_concurrent=min(burst, concurrency))
+
+def _client_session(concurrency: int = MAX_CONCURRENCY) -> aiohttp.ClientSession:
+    """aiohttp session with a bounded, DNS-caching connection pool."""
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    return aiohttp.ClientSession(connector=connector)
+
 def extract_podcast_id(url: str) -> Optional[str]:
     """Extract podcast ID from Apple Podcasts URL."""
-    match = re.search(r'/id(\d+)', url)
+    match = _ID_RE.search(url)
     return match.group(1) if match else None
 
-def get_recent_episodes_from_api(podcast_id: str) -> List[str]:
+def _episode_url(podcast_id: str, episode: Dict[str, Any]) -> Optional[str]:
+    """Build the Apple Podcasts URL for an iTunes API episode result."""
+    episode_id = episode.get('trackId')
+    if not episode_id:
+        return None
+    # Sanitize episode name for URL: each run of non-slug characters becomes one dash
+    episode_name = _SLUG_RE.sub('-', episode.get('trackName', '').lower()).strip('-')
+    return f"https://podcasts.apple.com/us/podcast/{episode_name}/id{podcast_id}?i={episode_id}"
+
+def _cached_lookup(podcast_id: str, ttl: int = LOOKUP_CACHE_TTL, use_cache: bool = True) -> Dict[str, Any]:
     """
-    Get recent episodes using Apple's iTunes API.
-    Limited to ~200 most recent episodes.
+    Look up a podcast and its ~200 most recent episodes via the iTunes API.
+    Responses are cached in CACHE_DIR for `ttl` seconds; `use_cache=False` forces a refetch.
     """
-    base_url = "https://itunes.apple.com/lookup"
+    cache_path = CACHE_DIR / f"lookup_{podcast_id}.json"
+    
+    if use_cache:
+        try:
+            if cache_path.stat().st_mtime > time.time() - ttl:
+                return orjson.loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass  # Missing or corrupt cache entry, refetch
+    
     params = {
         'id': podcast_id,
         'media': 'podcast',
         'entity': 'podcastEpisode',
-        'limit': 200  # iTunes API maximum
+        'limit': LOOKUP_PAGE_SIZE
     }
+    response = _SESSION.get(ITUNES_LOOKUP_URL, params=params, timeout=30)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
     
+    # Best effort: write to a temp file and rename so readers never see a partial entry
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    
+    return data
+
+def get_recent_episodes_from_api(podcast_id: str, use_cache: bool = True) -> List[str]:
+    """
+    Get recent episodes using Apple's iTunes API.
+    Limited to ~200 most recent episodes.
+    """
     try:
         console.print(f"[blue]Fetching recent episodes from iTunes API...[/blue]")
-        response = requests.get(base_url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = _cached_lookup(podcast_id, use_cache=use_cache)
         results = data.get('results', [])
         
         # Skip the first result which is podcast info, rest are episodes
@@ -59,14 +253,8 @@ def get_recent_episodes_from_api(podcast_id: str) -> List[str]:
         
         episode_urls = []
         for episode in episodes:
-            episode_id = episode.get('trackId')
-            episode_name = episode.get('trackName', '').replace(' ', '-').lower()
-            # Sanitize episode name for URL
-            episode_name = re.sub(r'[^a-z0-9-]', '-', episode_name)
-            episode_name = re.sub(r'-+', '-', episode_name).strip('-')
-            
-            if episode_id:
-                episode_url = f"https://podcasts.apple.com/us/podcast/{episode_name}/id{podcast_id}?i={episode_id}"
+            episode_url = _episode_url(podcast_id, episode)
+            if episode_url:
                 episode_urls.append(episode_url)
         
         console.print(f"[green]Found {len(episode_urls)} recent episodes[/green]")
@@ -79,96 +267,255 @@ def get_recent_episodes_from_api(podcast_id: str) -> List[str]:
         console.print(f"[red]Error parsing iTunes API response: {e}[/red]")
         return []
 
-def search_for_older_episodes(podcast_id: str, existing_urls: List[str], 
-                            start_episode: int = 1, end_episode: int = 200,
-                            max_requests: int = 50) -> List[str]:
+async def _read_results(response: aiohttp.ClientResponse) -> List[Dict[str, Any]]:
+    """
+    Stream-parse the `results` array of an iTunes API response, keeping only
+    the fields needed to build episode URLs (descriptions, artwork etc. are skipped).
+    """
+    response.raise_for_status()
+    results = []
+    try:
+        async for prefix, event, value in ijson.parse_async(response.content):
+            if prefix == 'results.item' and event == 'start_map':
+                results.append({})
+            elif prefix in _RESULT_PREFIXES:
+                results[-1][prefix[len('results.item.'):]] = value
+    except ijson.JSONError as e:
+        # ijson's errors aren't ValueErrors; callers treat a bad body like any other decode error
+        raise ValueError(f"Invalid JSON from {response.url}: {e}") from e
+    return results
+
+async def _search_one(session: aiohttp.ClientSession, sem: asyncio.Semaphore,
+                      limiter: AsyncRateLimiter, podcast_id: str, episode_num: int,
+                      seen: Set[str], budget: Dict[str, int]) -> Optional[Tuple[int, str]]:
     """
-    Search for older episodes by episode number using iTunes Search API.
-    Uses rate limiting to avoid 403 errors.
+    Search for a single episode number.
+    Returns (episode_num, url) for the first match not already in `seen`.
     """
-    console.print(f"[blue]Searching for episodes {start_episode}-{end_episode}...[/blue]")
+    search_terms = [
+        f"founders {episode_num}",
+        f"founders episode {episode_num}",
+    ]
     
+    for term in search_terms:
+        async with sem:
+            if budget['used'] >= budget['max']:
+                return None
+            budget['used'] += 1
+            
+            search_params = {
+                'term': term,
+                'media': 'podcast',
+                'entity': 'podcastEpisode',
+                'limit': 50
+            }
+            
+            try:
+                results = await _limited_request(
+                    session, limiter, 'GET', ITUNES_SEARCH_URL, _read_results,
+                    params=search_params, timeout=aiohttp.ClientTimeout(total=15)
+                )
+            except RateLimitedError:
+                raise RateLimitedError(episode_num) from None
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                continue
+        
+        for result in results:
+            if (result.get('collectionId') == int(podcast_id) and 
+                result.get('kind') == 'podcast-episode'):
+                
+                episode_url = _episode_url(podcast_id, result)
+                # No await between check and add, so this is safe across tasks
+                if episode_url and episode_url not in seen:
+                    seen.add(episode_url)
+                    console.print(f"[green]Found episode {episode_num}: {result.get('trackName', 'Unknown')}[/green]")
+                    return episode_num, episode_url
+    
+    return None
+
+async def _search_range(session: aiohttp.ClientSession, limiter: AsyncRateLimiter,
+                        podcast_id: str, seen: Set[str], start_episode: int,
+                        end_episode: int, budget: Dict[str, int],
+                        concurrency: int = MAX_CONCURRENCY) -> Dict[int, str]:
+    """Run episode-number searches concurrently. Returns {episode_num: url}."""
+    sem = asyncio.Semaphore(concurrency)
+    found = {}
+    
+    tasks = [
+        asyncio.create_task(_search_one(session, sem, limiter, podcast_id, episode_num, seen, budget))
+        for episode_num in range(start_episode, end_episode + 1)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result:
+                episode_num, episode_url = result
+                found[episode_num] = episode_url
+    except RateLimitedError as e:
+        console.print(f"[yellow]Rate limited, stopping search at episode {e}[/yellow]")
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    return found
+
+async def _lookup_older(session: aiohttp.ClientSession, limiter: AsyncRateLimiter,
+                        podcast_id: str, seen: Set[str], budget: Dict[str, int]) -> Optional[List[str]]:
+    """
+    Page through the podcast's episodes past the first lookup page using `offset`.
+    Returns the new URLs, or None if Apple ignored `offset` (a full page of known episodes).
+    If Apple rate limits a page, returns what earlier pages found.
+    """
     found_urls = []
-    requests_made = 0
+    offset = LOOKUP_PAGE_SIZE  # The first page is what get_recent_episodes_from_api fetched
     
-    for episode_num in range(start_episode, end_episode + 1):
-        if requests_made >= max_requests:
-            console.print(f"[yellow]Reached request limit ({max_requests}), stopping search[/yellow]")
+    while budget['used'] < budget['max']:
+        budget['used'] += 1
+        params = {
+            'id': podcast_id,
+            'media': 'podcast',
+            'entity': 'podcastEpisode',
+            'limit': LOOKUP_PAGE_SIZE,
+            'offset': offset
+        }
+        
+        try:
+            results = await _limited_request(
+                session, limiter, 'GET', ITUNES_LOOKUP_URL, _read_results,
+                params=params, timeout=aiohttp.ClientTimeout(total=30)
+            )
+        except RateLimitedError:
+            console.print(f"[yellow]Rate limited, stopping search at offset {offset}[/yellow]")
+            break
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            console.print(f"[yellow]Error paging iTunes lookup at offset {offset}: {e}[/yellow]")
             break
-            
-        search_terms = [
-            f"founders {episode_num}",
-            f"founders episode {episode_num}",
-        ]
         
-        episode_found = False
-        for term in search_terms:
-            if requests_made >= max_requests:
-                break
-                
-            try:
-                search_url = "https://itunes.apple.com/search"
-                search_params = {
-                    'term': term,
-                    'media': 'podcast',
-                    'entity': 'podcastEpisode',
-                    'limit': 50
-                }
-                
-                response = requests.get(search_url, params=search_params, timeout=15)
-                requests_made += 1
-                
-                if response.status_code == 403:
-                    console.print(f"[yellow]Rate limited, stopping search at episode {episode_num}[/yellow]")
-                    return found_urls
-                
-                response.raise_for_status()
-                
-                data = response.json()
-                results = data.get('results', [])
-                
-                for result in results:
-                    if (result.get('collectionId') == int(podcast_id) and 
-                        result.get('kind') == 'podcast-episode'):
-                        
-                        episode_id = result.get('trackId')
-                        episode_name = result.get('trackName', '').replace(' ', '-').lower()
-                        episode_name = re.sub(r'[^a-z0-9-]', '-', episode_name)
-                        episode_name = re.sub(r'-+', '-', episode_name).strip('-')
-                        
-                        if episode_id:
-                            episode_url = f"https://podcasts.apple.com/us/podcast/{episode_name}/id{podcast_id}?i={episode_id}"
-                            if episode_url not in existing_urls and episode_url not in found_urls:
-                                found_urls.append(episode_url)
-                                console.print(f"[green]Found episode {episode_num}: {result.get('trackName', 'Unknown')}[/green]")
-                                episode_found = True
-                                break
-                
-                time.sleep(0.5)  # Rate limiting
-                
-                if episode_found:
-                    break  # Found episode with this search term, move to next episode
-                    
-            except Exception as e:
-                if "403" in str(e):
-                    console.print(f"[yellow]Rate limited, stopping search[/yellow]")
-                    return found_urls
-                continue
+        episodes = [r for r in results if r.get('kind') == 'podcast-episode']
+        new_urls = []
+        for episode in episodes:
+            episode_url = _episode_url(podcast_id, episode)
+            if episode_url and episode_url not in seen:
+                seen.add(episode_url)
+                new_urls.append(episode_url)
         
-        # Longer pause between episodes to be more respectful
-        if episode_num % 10 == 0:
-            time.sleep(2)
+        # The podcast record may count against `limit`, so allow one short
+        full_page = len(episodes) >= LOOKUP_PAGE_SIZE - 1
+        if not new_urls:
+            return None if full_page and not found_urls else found_urls
+        
+        found_urls.extend(new_urls)
+        if not full_page:
+            break
+        offset += LOOKUP_PAGE_SIZE
+    
+    return found_urls
+
+async def _find_older(podcast_id: str, seen: Set[str], start_episode: int,
+                      end_episode: int, max_requests: int, concurrency: int) -> List[str]:
+    """Page the lookup endpoint, falling back to episode-number search if paging is unsupported."""
+    budget = {'used': 0, 'max': max_requests}
+    limiter = _make_limiter(concurrency)
+    
+    async with _client_session(concurrency) as session:
+        found_urls = await _lookup_older(session, limiter, podcast_id, seen, budget)
+        
+        if found_urls is None:
+            console.print(f"[yellow]iTunes lookup ignored offset, searching episodes {start_episode}-{end_episode} by number[/yellow]")
+            found = await _search_range(session, limiter, podcast_id, seen,
+                                        start_episode, end_episode, budget, concurrency)
+            found_urls = [found[episode_num] for episode_num in sorted(found)]
+    
+    if budget['used'] >= max_requests:
+        console.print(f"[yellow]Reached request limit ({max_requests}), stopping search[/yellow]")
+    
+    return found_urls
+
+def search_for_older_episodes(podcast_id: str, existing_urls: AbstractSet[str], 
+                            start_episode: int = 1, end_episode: int = 200,
+                            max_requests: int = 50, concurrency: int = MAX_CONCURRENCY) -> List[str]:
+    """
+    Find episodes older than the first iTunes lookup page.
+    Pages the lookup endpoint 200 episodes at a time; if Apple ignores the
+    offset, falls back to searching each episode number in the range with the
+    Search API. At most `concurrency` requests are in flight, all paced by an
+    adaptive rate limiter.
+    """
+    console.print("[blue]Searching for older episodes...[/blue]")
+    
+    seen = set(existing_urls)
+    found_urls = asyncio.run(_find_older(podcast_id, seen, start_episode, end_episode,
+                                         max_requests, concurrency))
     
     console.print(f"[green]Search found {len(found_urls)} additional episodes[/green]")
     return found_urls
 
-def validate_urls(urls: List[str], sample_size: int = 10) -> int:
+def _record_status(limiter: AsyncRateLimiter, status: int, headers: Mapping[str, str]) -> int:
+    """
+    Feed a validation response into the limiter without retrying it.
+    A 429 slows the remaining requests; any non-200 (including 403, which on a
+    podcasts.apple.com page means not accessible) just counts as invalid.
+    """
+    if status == 429:
+        limiter.on_throttle(_retry_after(headers, 0))
+    else:
+        limiter.on_success(_rate_limit_remaining(headers))
+    return status
+
+async def _validate_all(urls: List[str], headers: Dict[str, str], concurrency: int) -> int:
+    """HEAD all URLs concurrently, paced by the rate limiter. Returns the number returning 200."""
+    # A validation sample is small, so let it go out in one burst
+    limiter = _make_limiter(concurrency, burst=concurrency)
+    
+    async def head(session: aiohttp.ClientSession, url: str) -> int:
+        await limiter.acquire()
+        async with session.head(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10),
+                                allow_redirects=True) as response:
+            return _record_status(limiter, response.status, response.headers)
+    
+    async with _client_session(concurrency) as session:
+        # The connector's connection limit provides the backpressure here
+        statuses = await asyncio.gather(*(head(session, url) for url in urls), return_exceptions=True)
+    
+    return _count_valid(urls, statuses, (aiohttp.ClientError, asyncio.TimeoutError))
+
+async def _validate_all_http2(urls: List[str], headers: Dict[str, str], concurrency: int) -> int:
+    """Like _validate_all, but multiplexes every HEAD over one HTTP/2 connection with httpx."""
+    import httpx
+    limiter = _make_limiter(concurrency, burst=concurrency)
+    sem = asyncio.Semaphore(concurrency)  # Caps concurrent streams on the connection
+    
+    async def head(client: httpx.AsyncClient, url: str) -> int:
+        await limiter.acquire()
+        async with sem:
+            response = await client.head(url, follow_redirects=True)
+        return _record_status(limiter, response.status_code, response.headers)
+    
+    async with httpx.AsyncClient(http2=True, timeout=10, headers=headers) as client:
+        statuses = await asyncio.gather(*(head(client, url) for url in urls), return_exceptions=True)
+    
+    # InvalidURL (a malformed line) is not an HTTPError subclass
+    return _count_valid(urls, statuses, (httpx.HTTPError, httpx.InvalidURL))
+
+def _count_valid(urls: List[str], statuses: List[Any], network_errors: Tuple[type, ...]) -> int:
+    """Count 200 responses from gathered results, reporting network failures and re-raising anything else."""
+    valid_count = 0
+    for url, status in zip(urls, statuses):
+        if isinstance(status, network_errors):
+            console.print(f"[yellow]Could not reach {url}: {status!r}[/yellow]")
+        elif isinstance(status, BaseException):
+            raise status
+        elif status == 200:
+            valid_count += 1
+    
+    return valid_count
+
+def validate_urls(urls: List[str], sample_size: int = 10, concurrency: int = MAX_CONCURRENCY) -> int:
     """Validate a sample of URLs to check if they're accessible."""
     if not urls:
         return 0
     
     sample_urls = urls[:sample_size] if len(urls) > sample_size else urls
-    valid_count = 0
     
     headers = {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
@@ -176,26 +523,26 @@ def validate_urls(urls: List[str], sample_size: int = 10) -> int:
     
     console.print(f"[blue]Validating {len(sample_urls)} URLs...[/blue]")
     
-    for url in sample_urls:
-        try:
-            response = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
-            if response.status_code == 200:
-                valid_count += 1
-        except:
-            pass
-        time.sleep(0.2)  # Be respectful
+    # HTTP/2 needs httpx with the h2 extra; otherwise use the aiohttp path
+    try:
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+    except ImportError:
+        return asyncio.run(_validate_all(sample_urls, headers, concurrency))
     
-    return valid_count
+    return asyncio.run(_validate_all_http2(sample_urls, headers, concurrency))
 
 @app.command()
 def scrape(
     podcast_url: str = typer.Argument(..., help="Apple Podcasts URL (e.g., https://podcasts.apple.com/us/podcast/name/id123456)"),
     output: str = typer.Option("podcast_urls.txt", "--output", "-o", help="Output file for URLs"),
     search_older: bool = typer.Option(True, "--search-older/--no-search-older", help="Search for older episodes"),
-    search_range: str = typer.Option("1-200", "--range", "-r", help="Episode range to search (e.g., '1-100')"),
+    search_range: str = typer.Option("1-200", "--range", "-r", help="Episode range to search by number if lookup paging is unavailable (e.g., '1-100')"),
     max_search_requests: int = typer.Option(100, "--max-requests", help="Maximum search requests to avoid rate limiting"),
     validate: bool = typer.Option(True, "--validate/--no-validate", help="Validate a sample of URLs"),
-    append: bool = typer.Option(False, "--append", "-a", help="Append to existing file")
+    append: bool = typer.Option(False, "--append", "-a", help="Append to existing file"),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Use cached iTunes API responses (refreshed hourly)"),
+    concurrency: int = typer.Option(MAX_CONCURRENCY, "--concurrency", "-c", min=1, help="Maximum concurrent requests to Apple (still paced by the rate limiter)")
 ):
     """
     Scrape episode URLs from an Apple Podcasts page.
@@ -220,7 +567,9 @@ def scrape(
         console.print("[yellow]Make sure the URL is in format: https://podcasts.apple.com/us/podcast/name/id123456[/yellow]")
         raise typer.Exit(1)
     
+    # Ordered unique URLs, with `seen` for O(1) membership checks
     all_urls = []
+    seen = set()
     
     with Progress(
         SpinnerColumn(),
@@ -230,8 +579,11 @@ def scrape(
         
         # Get recent episodes from iTunes API
         task = progress.add_task("Fetching recent episodes...", total=None)
-        recent_urls = get_recent_episodes_from_api(podcast_id)
-        all_urls.extend(recent_urls)
+        recent_urls = get_recent_episodes_from_api(podcast_id, use_cache)
+        for url in recent_urls:
+            if url not in seen:
+                seen.add(url)
+                all_urls.append(url)
         progress.remove_task(task)
         
         # Search for older episodes if requested
@@ -245,8 +597,9 @@ def scrape(
             
             task = progress.add_task("Searching for older episodes...", total=None)
             older_urls = search_for_older_episodes(
-                podcast_id, all_urls, start_ep, end_ep, max_search_requests
+                podcast_id, seen, start_ep, end_ep, max_search_requests, concurrency
             )
+            # Already deduplicated against `seen` by the search
             all_urls.extend(older_urls)
             progress.remove_task(task)
     
@@ -254,45 +607,47 @@ def scrape(
         console.print("[red]No episode URLs found. The podcast might be private or the URL might be incorrect.[/red]")
         raise typer.Exit(1)
     
-    # Remove duplicates while preserving order
-    unique_urls = []
-    seen = set()
-    for url in all_urls:
-        if url not in seen:
-            unique_urls.append(url)
-            seen.add(url)
-    
-    console.print(f"[green]Found {len(unique_urls)} unique episodes[/green]")
+    console.print(f"[green]Found {len(all_urls)} unique episodes[/green]")
     
     # Validate URLs if requested
     if validate:
-        valid_count = validate_urls(unique_urls)
-        console.print(f"[blue]Validation: {valid_count}/{min(len(unique_urls), 10)} URLs are accessible[/blue]")
+        valid_count = validate_urls(all_urls, concurrency=concurrency)
+        console.print(f"[blue]Validation: {valid_count}/{min(len(all_urls), 10)} URLs are accessible[/blue]")
     
     # Save URLs to file
+    if append:
+        header = f"\n# Additional episodes from {podcast_url}\n"
+    else:
+        header = (f"# Podcast URLs extracted from {podcast_url}\n"
+                  f"# Total episodes: {len(all_urls)}\n"
+                  f"# Generated by Apple Podcast Scraper\n\n")
+    content = (header + "".join(f"{url}\n" for url in all_urls)).encode('utf-8')
+    
     try:
-        mode = 'a' if append else 'w'
-        with open(output, mode, encoding='utf-8') as f:
-            if not append:
-                f.write(f"# Podcast URLs extracted from {podcast_url}\n")
-                f.write(f"# Total episodes: {len(unique_urls)}\n")
-                f.write(f"# Generated by Apple Podcast Scraper\n\n")
-            elif append:
-                f.write(f"\n# Additional episodes from {podcast_url}\n")
-            
-            for url in unique_urls:
-                f.write(f"{url}\n")
+        if append:
+            with open(output, 'ab', buffering=1 << 20) as f:
+                f.write(content)
+        else:
+            # Write a temp file and rename it over the output so a crash never leaves it truncated
+            tmp_path = f"{output}.tmp"
+            try:
+                with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                    f.write(content)
+                os.replace(tmp_path, output)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
         
         action = "Added to" if append else "Saved to"
-        console.print(f"[green]{action} {output}: {len(unique_urls)} URLs[/green]")
+        console.print(f"[green]{action} {output}: {len(all_urls)} URLs[/green]")
         
         # Show preview
         console.print("\n[blue]Preview of first 5 URLs:[/blue]")
-        for i, url in enumerate(unique_urls[:5], 1):
+        for i, url in enumerate(islice(all_urls, 5), 1):
             console.print(f"  {i}. {url}")
         
-        if len(unique_urls) > 5:
-            console.print(f"  ... and {len(unique_urls) - 5} more")
+        if len(all_urls) > 5:
+            console.print(f"  ... and {len(all_urls) - 5} more")
             
     except Exception as e:
         console.print(f"[red]Error saving URLs to file: {e}[/red]")
@@ -324,7 +679,10 @@ def validate_file(
     console.print(f"[green]Validation complete: {valid_count}/{min(len(urls), sample_size)} URLs accessible ({success_rate:.1f}%)[/green]")
 
 @app.command()
-def info(podcast_url: str = typer.Argument(..., help="Apple Podcasts URL")):
+def info(
+    podcast_url: str = typer.Argument(..., help="Apple Podcasts URL"),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Use cached iTunes API responses (refreshed hourly)")
+):
     """Get basic information about a podcast."""
     
     podcast_id = extract_podcast_id(podcast_url)
@@ -333,13 +691,8 @@ def info(podcast_url: str = typer.Argument(..., help="Apple Podcasts URL")):
         raise typer.Exit(1)
     
     try:
-        base_url = "https://itunes.apple.com/lookup"
-        params = {'id': podcast_id}
-        
-        response = requests.get(base_url, params=params, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
+        # The first lookup result is the podcast itself
+        data = _cached_lookup(podcast_id, use_cache=use_cache)
         results = data.get('results', [])
         
         if not results:
@@ -6,11 +6,16 @@ Reads URLs from a txt file and processes them for transcription.
 
 import os
 import sys
+import queue
+import shutil
 import subprocess
 import tempfile
+import threading
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from uuid import uuid4
+from typing import Any, Dict, List, Optional, Tuple
 import typer
 import pyperclip
 import yt_dlp
@@ -20,12 +25,24 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 app = typer.Typer()
 console = Console()
 
+_INVALID_FN_RE = re.compile(r'[<>:"/\\|?*]')
+_UNDERSCORE_RE = re.compile(r'_+')
+_UNTITLED_RE = re.compile(r'transcript_(\d+)\.txt')
+
+DOWNLOAD_WORKERS = 4  # Default parallel downloads (--concurrency)
+DOWNLOAD_QUEUE_SIZE = 4  # Downloaded-but-untranscribed episodes kept on disk
+
+_MODEL_CACHE: Dict[str, Any] = {}
+_MODEL_LOCK = threading.Lock()
+
+_next_untitled_index: Optional[int] = None  # Scanned from transcripts/ on first use
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename by removing invalid characters."""
     # Remove invalid characters and replace with underscores
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = _INVALID_FN_RE.sub('_', filename)
     # Remove multiple underscores
-    filename = re.sub(r'_+', '_', filename)
+    filename = _UNDERSCORE_RE.sub('_', filename)
     # Remove leading/trailing underscores and dots
     filename = filename.strip('_.')
     return filename
@@ -49,16 +66,33 @@ def _progress_hook(d):
     elif d['status'] == 'finished':
         print(f"\rDownload completed: {d['filename']}")  # New line after completion
 
-def download_audio(url: str, output_dir: str) -> Optional[Tuple[str, str]]:
-    """Download audio from URL using yt-dlp. Returns (audio_file_path, title)."""
+def _abort_hook(stop: threading.Event):
+    """yt-dlp progress hook that aborts the download once `stop` is set."""
+    def hook(d):
+        if stop.is_set():
+            raise yt_dlp.utils.DownloadCancelled("Download stopped")
+    return hook
+
+def download_audio(url: str, output_dir: str, show_progress: bool = True,
+                   stop: Optional[threading.Event] = None) -> Optional[Tuple[str, str]]:
+    """
+    Download audio from URL using yt-dlp. Returns (audio_file_path, title).
+    Pass show_progress=False when several downloads run at once, so their progress lines don't interleave.
+    Setting `stop` aborts the download at its next progress update.
+    """
+    progress_hooks = [_progress_hook] if show_progress else []
+    if stop is not None:
+        progress_hooks.append(_abort_hook(stop))
+    
     ydl_opts = {
         'format': 'bestaudio/best',
         'outtmpl': os.path.join(output_dir, '%(title)s.%(ext)s'),
-        'extractaudio': True,
-        'audioformat': 'mp3',
-        'audioquality': '192K',
-        'progress_hooks': [_progress_hook],
-        'quiet': False,
+        # No postprocessing: faster-whisper decodes the downloaded stream straight
+        # to 16kHz mono itself, so any transcode here would just be decoded again
+        'postprocessors': [],
+        'progress_hooks': progress_hooks,
+        'quiet': not show_progress,
+        'noprogress': not show_progress,
         'no_warnings': False,
     }
     
@@ -66,38 +100,61 @@ def download_audio(url: str, output_dir: str) -> Optional[Tuple[str, str]]:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=True)
             title = info.get('title', 'Unknown')
-            filename = ydl.prepare_filename(info)
-            # Change extension to mp3 since we're extracting audio
-            audio_file = os.path.splitext(filename)[0] + '.mp3'
-            final_audio_file = audio_file if os.path.exists(audio_file) else filename
-            return (final_audio_file, title) if final_audio_file else None
+            audio_file = ydl.prepare_filename(info)
+            return (audio_file, title) if os.path.exists(audio_file) else None
+    except yt_dlp.utils.DownloadCancelled:
+        return None
     except Exception as e:
         console.print(f"[red]Error downloading {url}: {e}[/red]")
         return None
 
+def _get_model(name: str) -> Any:
+    """Load a faster-whisper model once per process and reuse it across episodes."""
+    with _MODEL_LOCK:
+        if name not in _MODEL_CACHE:
+            import ctranslate2
+            from faster_whisper import WhisperModel
+            # CTranslate2 runs on CUDA or CPU: fp16 on GPU, int8 quantization on CPU
+            compute_type = "float16" if ctranslate2.get_cuda_device_count() > 0 else "int8"
+            _MODEL_CACHE[name] = WhisperModel(name, device="auto", compute_type=compute_type)
+        return _MODEL_CACHE[name]
+
 def transcribe_audio(audio_file: str, model: str = "base") -> str:
-    """Transcribe audio using whisper or placeholder."""
+    """Transcribe audio using faster-whisper or placeholder."""
     try:
-        import whisper
         console.print(f"[blue]Transcribing with Whisper model: {model}[/blue]")
         
-        # Load whisper model
-        whisper_model = whisper.load_model(model)
+        # Load whisper model (cached after the first episode)
+        whisper_model = _get_model(model)
         
-        # Transcribe
-        result = whisper_model.transcribe(audio_file)
-        return result["text"].strip()
+        # Transcribe the raw download; faster-whisper decodes it to 16kHz mono PCM in one pass.
+        # Segments are generated lazily as decoding proceeds
+        segments, _ = whisper_model.transcribe(audio_file, beam_size=5)
+        return "".join(segment.text for segment in segments).strip()
         
     except ImportError:
         console.print(f"[yellow]Note: Using placeholder transcription for {audio_file}[/yellow]")
-        console.print("[yellow]To enable real transcription, install: pip install openai-whisper[/yellow]")
+        console.print("[yellow]To enable real transcription, install: pip install faster-whisper[/yellow]")
         
         # Return a placeholder transcript
-        return f"[PLACEHOLDER TRANSCRIPT] Audio file: {os.path.basename(audio_file)}\nThis would contain the actual transcription when whisper is properly installed."
+        return f"[PLACEHOLDER TRANSCRIPT] Audio file: {os.path.basename(audio_file)}\nThis would contain the actual transcription when faster-whisper is properly installed."
     except Exception as e:
         console.print(f"[red]Error transcribing audio: {e}[/red]")
         return f"[ERROR] Failed to transcribe: {str(e)}"
 
+def _untitled_index(transcripts_dir: Path) -> int:
+    """Next free transcript_N number; the directory is only scanned on the first call."""
+    global _next_untitled_index
+    if _next_untitled_index is None:
+        _next_untitled_index = 1 + max(
+            (int(m.group(1)) for p in transcripts_dir.glob('transcript_*.txt')
+             if (m := _UNTITLED_RE.fullmatch(p.name))),
+            default=0
+        )
+    index = _next_untitled_index
+    _next_untitled_index += 1
+    return index
+
 def save_transcript_to_file(transcript: str, title: str, url: str) -> str:
     """Save transcript to transcripts folder with episode name."""
     # Create transcripts directory if it doesn't exist
@@ -107,7 +164,7 @@ def save_transcript_to_file(transcript: str, title: str, url: str) -> str:
     # Sanitize title for filename
     filename = sanitize_filename(title)
     if not filename or filename == "Unknown":
-        filename = f"transcript_{len(list(transcripts_dir.glob('*.txt'))) + 1}"
+        filename = f"transcript_{_untitled_index(transcripts_dir)}"
     
     # Ensure .txt extension
     if not filename.endswith('.txt'):
@@ -116,13 +173,9 @@ def save_transcript_to_file(transcript: str, title: str, url: str) -> str:
     # Create full path
     filepath = transcripts_dir / filename
     
-    # Add counter if file exists
-    counter = 1
-    original_filepath = filepath
-    while filepath.exists():
-        name_without_ext = original_filepath.stem
-        filepath = transcripts_dir / f"{name_without_ext}_{counter}.txt"
-        counter += 1
+    # Add a random suffix if file exists
+    if filepath.exists():
+        filepath = transcripts_dir / f"{filepath.stem}_{uuid4().hex[:6]}.txt"
     
     # Prepare content with metadata
     content = f"""Episode: {title}
@@ -133,13 +186,17 @@ Transcribed: {Path().cwd()}
 
 {transcript}"""
     
-    # Save to file
+    # Save to file: one buffered write to a temp file, then an atomic rename so a
+    # crash never leaves a truncated transcript behind
+    tmp_path = filepath.with_suffix('.txt.tmp')
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(content.encode('utf-8'))
+        os.replace(tmp_path, filepath)
         console.print(f"[green]Transcript saved to: {filepath}[/green]")
         return str(filepath)
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         console.print(f"[red]Error saving transcript: {e}[/red]")
         return ""
 
@@ -164,6 +221,28 @@ def process_url(url: str, model: str = "base") -> Optional[Tuple[str, str, str]]
         
         return (transcript, title, filepath)
 
+def _download_worker(index: int, url: str, temp_dir: str, downloads: queue.Queue,
+                     stop: threading.Event, show_progress: bool):
+    """
+    Download one URL into its own directory and hand it to the transcription loop.
+    Always queues an entry (download_result None on failure) so the consumer never waits forever.
+    """
+    url_dir = None
+    download_result = None
+    try:
+        url_dir = tempfile.mkdtemp(dir=temp_dir)
+        download_result = download_audio(url, url_dir, show_progress, stop)
+    except Exception as e:
+        console.print(f"[red]Error downloading {url}: {e}[/red]")
+    finally:
+        # Block while the queue is full, but give up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                downloads.put((index, url, url_dir, download_result), timeout=0.5)
+                break
+            except queue.Full:
+                continue
+
 def read_urls_from_file(file_path: str) -> List[str]:
     """Read URLs from a text file, one per line."""
     try:
@@ -181,7 +260,8 @@ def read_urls_from_file(file_path: str) -> List[str]:
 def process_urls(
     urls_file: str = typer.Argument(..., help="Path to file containing URLs (one per line)"),
     model: str = typer.Option("base", "--model", "-m", help="Whisper model to use (tiny, base, small, medium, large)"),
-    copy_to_clipboard: bool = typer.Option(True, "--clipboard/--no-clipboard", help="Copy transcripts to clipboard")
+    copy_to_clipboard: bool = typer.Option(True, "--clipboard/--no-clipboard", help="Copy transcripts to clipboard"),
+    concurrency: int = typer.Option(DOWNLOAD_WORKERS, "--concurrency", "-c", min=1, help="Number of episodes to download in parallel while transcribing")
 ):
     """Process multiple URLs from a file and transcribe them."""
     
@@ -196,28 +276,54 @@ def process_urls(
     
     console.print(f"[blue]Found {len(urls)} URLs to process[/blue]")
     
-    all_transcripts = []
-    processed_files = []
+    results: List[Optional[Tuple[str, str, str]]] = [None] * len(urls)
+    
+    # Downloads run in a thread pool while this thread transcribes whatever has
+    # finished downloading; the bounded queue caps how far downloads run ahead.
+    downloads: queue.Queue = queue.Queue(maxsize=DOWNLOAD_QUEUE_SIZE)
+    stop = threading.Event()
     
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
-    ) as progress:
+    ) as progress, tempfile.TemporaryDirectory() as temp_dir:
         
-        for i, url in enumerate(urls, 1):
-            task = progress.add_task(f"Processing URL {i}/{len(urls)}", total=None)
-            
-            result = process_url(url, model)
-            if result:
-                transcript, title, filepath = result
-                all_transcripts.append(f"Episode: {title}\nURL: {url}\nFile: {filepath}\n{'-'*80}\n{transcript}")
-                processed_files.append(filepath)
-                console.print(f"[green]✓ Completed {i}/{len(urls)}: {title}[/green]")
-            else:
-                console.print(f"[red]✗ Failed to process: {url}[/red]")
+        dl_pool = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            for index, url in enumerate(urls):
+                dl_pool.submit(_download_worker, index, url, temp_dir, downloads, stop,
+                               concurrency == 1)
             
-            progress.remove_task(task)
+            for i in range(1, len(urls) + 1):
+                task = progress.add_task(f"Processing URL {i}/{len(urls)}", total=None)
+                
+                index, url, url_dir, download_result = downloads.get()
+                if download_result:
+                    audio_file, title = download_result
+                    console.print(f"[green]Downloaded: {os.path.basename(audio_file)}[/green]")
+                    
+                    transcript = transcribe_audio(audio_file, model)
+                    filepath = save_transcript_to_file(transcript, title, url)
+                    results[index] = (transcript, title, filepath)
+                    console.print(f"[green]✓ Completed {i}/{len(urls)}: {title}[/green]")
+                else:
+                    console.print(f"[red]✗ Failed to process: {url}[/red]")
+                
+                if url_dir:
+                    shutil.rmtree(url_dir, ignore_errors=True)
+                progress.remove_task(task)
+        finally:
+            stop.set()
+            dl_pool.shutdown(wait=True, cancel_futures=True)
+    
+    all_transcripts = []
+    processed_files = []
+    for url, result in zip(urls, results):
+        if result:
+            transcript, title, filepath = result
+            all_transcripts.append(f"Episode: {title}\nURL: {url}\nFile: {filepath}\n{'-'*80}\n{transcript}")
+            processed_files.append(filepath)
     
     if all_transcripts:
         combined_transcript = "\n\n".join(all_transcripts)